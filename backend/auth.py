@@ -1,81 +1,260 @@
+import asyncio
+import json
 import jwt
+import orjson
 import hashlib
+import hmac
 import secrets
+import time
+from cachetools import TTLCache
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from string import Template
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from passlib.context import CryptContext
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
 import os
-from models import User, UserRole
+from models import User
+from database import get_database
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-import smtplib
+import aiosmtplib
 
 # Security setup
 SECRET_KEY = os.environ.get("SECRET_KEY", "your-secret-key-here")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Optional Rust-backed JOSE implementation for faster encode/decode on the
+# per-request token path. Falls back to PyJWT when not installed.
+try:
+    import jwtoxide
+    _JWT_VALIDATION_OPTIONS = jwtoxide.ValidationOptions(
+        aud=None,
+        iss=None,
+        required_spec_claims={"exp"},
+        validate_aud=False,
+        algorithms=[ALGORITHM]
+    )
+except ImportError:
+    jwtoxide = None
+    _JWT_VALIDATION_OPTIONS = None
+
+# PyJWT re-runs HMACAlgorithm.prepare_key (encode + PEM/JWK sniffing) on every
+# encode/decode. The secret never changes, so prepare it once and hand the
+# cached bytes back on the per-request fallback path.
+class _CachedHMACAlgorithm(jwt.algorithms.HMACAlgorithm):
+    def __init__(self, hash_alg):
+        super().__init__(hash_alg)
+        self._prepared_key = super().prepare_key(SECRET_KEY)
+
+    def prepare_key(self, key):
+        if key == SECRET_KEY:
+            return self._prepared_key
+        return super().prepare_key(key)
+
+jwt.api_jws._jws_global_obj._algorithms[ALGORITHM] = _CachedHMACAlgorithm(
+    jwt.algorithms.HMACAlgorithm.SHA256
+)
+
+# Serialize/parse JWT headers and claims with orjson instead of stdlib json.
+# Installed as the `json` name inside PyJWT's api modules only, so nothing
+# else sees the swap; custom json_encoder classes fall back to stdlib.
+class _OrjsonBackend:
+    @staticmethod
+    def dumps(obj, separators=None, cls=None, sort_keys=False, **kwargs):
+        if cls is not None:
+            return json.dumps(
+                obj, separators=separators, cls=cls, sort_keys=sort_keys, **kwargs
+            )
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, option=option).decode()
+
+    @staticmethod
+    def loads(s):
+        return orjson.loads(s)
+
+jwt.api_jws.json = _OrjsonBackend
+jwt.api_jwt.json = _OrjsonBackend
+
+# Prefer argon2 for new hashes (faster C implementation, memory-hard) while
+# still verifying existing bcrypt hashes; deprecated="auto" re-hashes those
+# lazily. Costs are tunable per deployment hardware via environment.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    default="argon2",
+    deprecated="auto",
+    argon2__time_cost=int(os.environ.get("ARGON2_TIME_COST", "2")),
+    argon2__memory_cost=int(os.environ.get("ARGON2_MEMORY_KIB", "65536")),
+    bcrypt__rounds=int(os.environ.get("BCRYPT_ROUNDS", "11"))
+)
 security = HTTPBearer()
 
+# New hashes are computed over sha256(password + pepper) instead of the raw
+# password: fixed-length input, no 72-byte bcrypt truncation, and the cheap
+# SHA-256 step is cacheable. Legacy bcrypt hashes were created from the raw
+# password and are detected by scheme (hash_password only ever emits argon2),
+# then upgraded on the next successful login.
+PASSWORD_PEPPER = os.environ.get("PASSWORD_PEPPER", "").encode()
+
+# Only pull the fields the User model actually carries; user docs can grow
+# profile blobs etc. that the hot auth path has no use for
+_USER_PROJECTION = {"_id": 0, **{field: 1 for field in User.model_fields}}
+
+def _prehash_password(password: str) -> str:
+    return hashlib.sha256(password.encode() + PASSWORD_PEPPER).hexdigest()
+
+# Verified against on the "user not found" branch of authenticate_user so that
+# failed logins take the same wall time whether or not the email exists.
+# Computed eagerly at import so a gunicorn/uvicorn --preload setup pays the
+# hash cost once before forking and workers share the page copy-on-write.
+# Deployments that skip preload can pass a precomputed hash via AUTH_DUMMY_HASH
+# to avoid burning one full password hash per worker at boot.
+_DUMMY_HASH = (
+    os.environ.get("AUTH_DUMMY_HASH")
+    or pwd_context.hash(_prehash_password("not-a-real-password"))
+)
+
+# Optional cache for password verification results (enable with AUTH_VERIFY_CACHE=1).
+# Repeated logins with the same credentials skip the ~100-250ms bcrypt verify.
+# Keys are HMAC-SHA256 digests of the plaintext (never the raw password) plus the
+# stored hash, so a password change invalidates the entry automatically.
+AUTH_VERIFY_CACHE = os.environ.get("AUTH_VERIFY_CACHE", "0") == "1"
+_VERIFY_CACHE_MAX = 4096
+_verify_cache_pepper = secrets.token_bytes(32)
+_verify_cache = OrderedDict()
+
+# last_login stamps are buffered here and flushed in bulk by a background task
+# so successful logins don't pay an extra Mongo write on the critical path
+LAST_LOGIN_FLUSH_SECONDS = float(os.environ.get("LAST_LOGIN_FLUSH_SECONDS", "5"))
+_last_login_buffer = {}
+
+async def flush_last_logins(db):
+    """Write buffered last_login stamps to Mongo in a single bulk_write"""
+    if not _last_login_buffer:
+        return
+    drained = dict(_last_login_buffer)
+    _last_login_buffer.clear()
+    await db.users.bulk_write(
+        [UpdateOne({"id": uid}, {"$set": {"last_login": ts}}) for uid, ts in drained.items()],
+        ordered=False
+    )
+
+def start_last_login_flusher(db):
+    """Start the periodic last_login flush task; returns the task so the
+    caller can cancel it on shutdown (after a final flush)."""
+    async def _run():
+        while True:
+            await asyncio.sleep(LAST_LOGIN_FLUSH_SECONDS)
+            try:
+                await flush_last_logins(db)
+            except Exception as e:
+                print(f"Failed to flush last_login buffer: {e}")
+    return asyncio.create_task(_run())
+
 class AuthHandler:
     def __init__(self, db):
         self.db = db
     
-    def hash_password(self, password: str) -> str:
-        return pwd_context.hash(password)
-    
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+    async def hash_password(self, password: str) -> str:
+        # CPU-bound (~100-250ms); run in a worker thread so the event loop
+        # keeps serving other requests
+        return await asyncio.to_thread(pwd_context.hash, _prehash_password(password))
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        # Legacy bcrypt hashes cover the raw password; everything newer covers
+        # the sha256 pre-hash
+        if pwd_context.identify(hashed_password, required=False) != "bcrypt":
+            plain_password = _prehash_password(plain_password)
+        if not AUTH_VERIFY_CACHE:
+            return await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
+
+        key = (
+            hmac.new(_verify_cache_pepper, plain_password.encode(), hashlib.sha256).hexdigest(),
+            hashed_password
+        )
+        cached = _verify_cache.get(key)
+        if cached is not None:
+            _verify_cache.move_to_end(key)
+            return cached
+
+        result = await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
+        _verify_cache[key] = result
+        if len(_verify_cache) > _VERIFY_CACHE_MAX:
+            _verify_cache.popitem(last=False)
+        return result
     
     def create_access_token(self, data: dict, expires_delta: timedelta = None):
         to_encode = data.copy()
+        # exp is just an integer epoch; skip the datetime round trip PyJWT
+        # would otherwise undo during serialization
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = int(time.time() + expires_delta.total_seconds())
         else:
-            expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-        to_encode.update({"exp": expire})
+            expire = int(time.time()) + ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        to_encode["exp"] = expire
+        if jwtoxide is not None:
+            return jwtoxide.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         return encoded_jwt
-    
+
     def decode_token(self, token: str):
+        if jwtoxide is not None:
+            # jwtoxide raises a plain Exception (not InvalidTokenError) for
+            # malformed tokens - undecodable base64 segments, headers without
+            # alg - so anything other than an expiry must map to the 401 here
+            # rather than escape as a 500
+            try:
+                return jwtoxide.decode(token, SECRET_KEY, _JWT_VALIDATION_OPTIONS)
+            except jwtoxide.ExpiredSignatureError:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Token expired"
+                )
+            except Exception:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid token"
+                )
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            return payload
+            return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         except jwt.ExpiredSignatureError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Token expired"
             )
-        except jwt.JWTError:
+        except jwt.PyJWTError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token"
             )
     
     async def get_user_by_email(self, email: str):
-        user = await self.db.users.find_one({"email": email})
+        user = await self.db.users.find_one({"email": email}, _USER_PROJECTION)
         if user:
-            return User(**user)
+            # Data was validated on the way in; skip validator dispatch here
+            return User.model_construct(**user)
         return None
-    
+
     async def get_user_by_id(self, user_id: str):
-        user = await self.db.users.find_one({"id": user_id})
+        user = await self.db.users.find_one({"id": user_id}, _USER_PROJECTION)
         if user:
-            return User(**user)
+            return User.model_construct(**user)
         return None
     
     async def create_user(self, user_data: dict):
         # Hash password
-        user_data["password"] = self.hash_password(user_data["password"])
-        
-        # Create user object to generate ID
-        from models import User
+        user_data["password"] = await self.hash_password(user_data["password"])
+
+        # Create user object to generate ID and defaults. The model honours
+        # incoming fields like is_verified, so callers seeding pre-verified
+        # users don't need a follow-up update_one. The password hash is not a
+        # model field and is re-attached to the stored doc explicitly.
         user_obj = User(**user_data)
-        user_dict = user_obj.dict()
-        
+        user_dict = user_obj.model_dump()
+        user_dict["password"] = user_data["password"]
+
         # Create user in database
         result = await self.db.users.insert_one(user_dict)
         if result.inserted_id:
@@ -83,24 +262,37 @@ class AuthHandler:
         return None
     
     async def authenticate_user(self, email: str, password: str):
-        user = await self.get_user_by_email(email)
-        if not user:
-            return None
-        
-        # Get password from database (since User model doesn't include password field)
-        user_doc = await self.db.users.find_one({"email": email})
+        # Single fetch: verify against the raw doc, then build the User model
+        # from the same dict (minus the password field it doesn't carry)
+        user_doc = await self.db.users.find_one(
+            {"email": email},
+            {**_USER_PROJECTION, "password": 1}
+        )
         if not user_doc or "password" not in user_doc:
+            # Burn a bcrypt verify anyway so response timing doesn't reveal
+            # whether the email is registered
+            await self.verify_password(password, _DUMMY_HASH)
             return None
-            
-        if not self.verify_password(password, user_doc["password"]):
+
+        if not await self.verify_password(password, user_doc["password"]):
             return None
-        
-        # Update last login
-        await self.db.users.update_one(
-            {"id": user.id},
-            {"$set": {"last_login": datetime.utcnow()}}
+
+        # Lazily migrate deprecated (bcrypt-era, raw-password) hashes to the
+        # current pre-hashed argon2 scheme
+        if pwd_context.needs_update(user_doc["password"]):
+            new_hash = await self.hash_password(password)
+            await self.db.users.update_one(
+                {"id": user_doc["id"]},
+                {"$set": {"password": new_hash}}
+            )
+
+        user = User.model_construct(
+            **{k: v for k, v in user_doc.items() if k != "password"}
         )
         
+        # Update last login (buffered; flushed periodically in bulk)
+        _last_login_buffer[user.id] = datetime.utcnow()
+
         return user
     
     def generate_verification_token(self, email: str) -> str:
@@ -126,57 +318,95 @@ class AuthHandler:
         )
         return result.modified_count > 0
 
+# Cache of verified tokens -> (user, exp). Saves one HMAC verify plus one Mongo
+# find_one per request on hit; entries expire after 60s or at the token's own
+# exp, whichever comes first, so revocation-by-expiry still holds.
+_token_cache = TTLCache(maxsize=10_000, ttl=60)
+
+def _get_cached_token_user(token: str):
+    cached = _token_cache.get(token)
+    if cached is None:
+        return None
+    user, exp = cached
+    if exp is not None and exp <= time.time():
+        _token_cache.pop(token, None)
+        return None
+    return user
+
 # Dependency to get current user
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db = None
+    db = Depends(get_database)
 ):
     if db is None:
-        # This will be injected in the main app
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database not configured"
         )
-    
+
     auth_handler = AuthHandler(db)
     token = credentials.credentials
+
+    cached_user = _get_cached_token_user(token)
+    if cached_user is not None:
+        return cached_user
+
     payload = auth_handler.decode_token(token)
-    
+
     user_id = payload.get("sub")
     if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials"
         )
-    
+
     user = await auth_handler.get_user_by_id(user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
-    
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
-    
+
+    _token_cache[token] = (user, payload.get("exp"))
     return user
 
-# Role-based access control decorators
+# Role-based access control dependency factory.
+# Usage: current_user: User = Depends(require_role([UserRole.ADMIN]))
+# Living in FastAPI's dependency graph means the check is compiled once per
+# route and shares the request-scoped dependency cache with get_current_user,
+# instead of paying a wrapper frame + kwargs lookup per call.
 def require_role(allowed_roles: list):
-    def decorator(func):
-        async def wrapper(*args, **kwargs):
-            current_user = kwargs.get('current_user')
-            if not current_user or current_user.role not in allowed_roles:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Insufficient permissions"
-                )
-            return await func(*args, **kwargs)
-        return wrapper
-    return decorator
+    # Frozen once at route-definition time: O(1) membership test per request
+    allowed = frozenset(allowed_roles)
+
+    async def dependency(current_user: User = Depends(get_current_user)) -> User:
+        if current_user.role not in allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Insufficient permissions"
+            )
+        return current_user
+    return dependency
+
+# Email templates, built once at import instead of per send
+_VERIFICATION_EMAIL_TEMPLATE = Template("""
+        <html>
+        <body>
+            <h2>Welcome to GO Learning Platform!</h2>
+            <p>Please click the link below to verify your email address:</p>
+            <p><a href="$verification_url" style="background-color: #4CAF50; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">Verify Email</a></p>
+            <p>If the button doesn't work, copy and paste this link into your browser:</p>
+            <p>$verification_url</p>
+            <p>This link will expire in 24 hours.</p>
+        </body>
+        </html>
+        """)
 
 # Email utility functions
 class EmailService:
@@ -186,25 +416,31 @@ class EmailService:
         self.smtp_user = os.environ.get("SMTP_USER", "")
         self.smtp_password = os.environ.get("SMTP_PASSWORD", "")
         self.from_email = os.environ.get("FROM_EMAIL", "noreply@golearn.com")
+        # Persistent SMTP connection, created lazily and reused across sends
+        # so each email doesn't pay a fresh TCP+TLS handshake
+        self.enabled = bool(self.smtp_user)
+        self._smtp_client = None
+        self._smtp_lock = asyncio.Lock()
+
+    async def _get_smtp_client(self):
+        if self._smtp_client is None:
+            self._smtp_client = aiosmtplib.SMTP(
+                hostname=self.smtp_server,
+                port=self.smtp_port,
+                start_tls=True
+            )
+        if not self._smtp_client.is_connected:
+            await self._smtp_client.connect()
+            await self._smtp_client.login(self.smtp_user, self.smtp_password)
+        return self._smtp_client
     
     async def send_verification_email(self, email: str, token: str):
         """Send email verification"""
         verification_url = f"{os.environ.get('FRONTEND_URL', 'http://localhost:3000')}/verify-email?token={token}"
         
         subject = "Verify your email - GO Learning Platform"
-        body = f"""
-        <html>
-        <body>
-            <h2>Welcome to GO Learning Platform!</h2>
-            <p>Please click the link below to verify your email address:</p>
-            <p><a href="{verification_url}" style="background-color: #4CAF50; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">Verify Email</a></p>
-            <p>If the button doesn't work, copy and paste this link into your browser:</p>
-            <p>{verification_url}</p>
-            <p>This link will expire in 24 hours.</p>
-        </body>
-        </html>
-        """
-        
+        body = _VERIFICATION_EMAIL_TEMPLATE.substitute(verification_url=verification_url)
+
         await self.send_email(email, subject, body)
     
     async def send_email(self, to_email: str, subject: str, body: str):
@@ -217,12 +453,23 @@ class EmailService:
             
             html_part = MIMEText(body, 'html')
             msg.attach(html_part)
-            
-            # In production, you would use actual SMTP server
-            # For now, we'll just log it
-            print(f"EMAIL SENT TO: {to_email}")
-            print(f"SUBJECT: {subject}")
-            print(f"BODY: {body}")
-            
+
+            if not self.enabled:
+                # No SMTP credentials configured - just log it
+                print(f"EMAIL SENT TO: {to_email}")
+                print(f"SUBJECT: {subject}")
+                print(f"BODY: {body}")
+                return
+
+            async with self._smtp_lock:
+                try:
+                    client = await self._get_smtp_client()
+                    await client.send_message(msg)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # Stale connection; reconnect once and retry
+                    self._smtp_client = None
+                    client = await self._get_smtp_client()
+                    await client.send_message(msg)
+
         except Exception as e:
             print(f"Failed to send email: {e}")
\ No newline at end of file
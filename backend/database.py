@@ -1,3 +1,5 @@
+import asyncio
+from pymongo import IndexModel, UpdateOne
 from motor.motor_asyncio import AsyncIOMotorClient
 from models import Achievement
 import os
@@ -13,7 +15,18 @@ async def get_database():
 
 async def connect_to_mongo():
     """Create database connection"""
-    database.client = AsyncIOMotorClient(os.environ["MONGO_URL"])
+    # Pool sized for one asyncio process: maxPoolSize should cover peak
+    # concurrent in-flight DB ops (scale with uvicorn workers x ops per
+    # request), the min floor keeps warm connections so bursts don't pay
+    # connection + TLS setup, and the timeouts fail fast instead of queueing
+    # indefinitely when Mongo is saturated or unreachable.
+    database.client = AsyncIOMotorClient(
+        os.environ["MONGO_URL"],
+        maxPoolSize=int(os.environ.get("MONGO_MAX_POOL_SIZE", "200")),
+        minPoolSize=int(os.environ.get("MONGO_MIN_POOL_SIZE", "20")),
+        waitQueueTimeoutMS=5000,
+        serverSelectionTimeoutMS=3000
+    )
     database.database = database.client[os.environ["DB_NAME"]]
     
     # Create indexes for better performance
@@ -29,35 +42,64 @@ async def close_mongo_connection():
 async def create_indexes():
     """Create database indexes"""
     db = database.database
-    
-    # User indexes
-    await db.users.create_index("email", unique=True)
-    await db.users.create_index("id", unique=True)
-    
-    # Class indexes
-    await db.classes.create_index("teacher_id")
-    await db.classes.create_index("class_code", unique=True)
-    
-    # Lesson indexes
-    await db.lessons.create_index("created_by")
-    await db.lessons.create_index("difficulty")
-    await db.lessons.create_index("order_index")
-    
-    # Quiz indexes
-    await db.quizzes.create_index("lesson_id")
-    await db.quizzes.create_index("created_by")
-    
-    # Progress indexes
-    await db.lesson_progress.create_index([("user_id", 1), ("lesson_id", 1)], unique=True)
-    await db.quiz_attempts.create_index("user_id")
-    await db.quiz_attempts.create_index("quiz_id")
-    
-    # Achievement indexes
-    await db.user_achievements.create_index([("user_id", 1), ("achievement_id", 1)], unique=True)
-    
-    # Notification indexes
-    await db.notifications.create_index("user_id")
-    await db.notifications.create_index("created_at")
+
+    # One createIndexes command per collection (all indexes for a collection
+    # travel in a single round trip), with the per-collection commands running
+    # concurrently
+    await asyncio.gather(
+        # User indexes
+        db.users.create_indexes([
+            IndexModel("email", unique=True),
+            IndexModel("id", unique=True)
+        ]),
+
+        # Class indexes; students is multikey for the "classes I'm enrolled
+        # in" query, and (id, class_code) covers the join-by-code filter
+        db.classes.create_indexes([
+            IndexModel("teacher_id"),
+            IndexModel("class_code", unique=True),
+            IndexModel([("id", 1), ("class_code", 1)]),
+            IndexModel("students")
+        ]),
+
+        # Lesson indexes; the compound serves the published list view with
+        # its difficulty filter and order_index sort in one scan
+        db.lessons.create_indexes([
+            IndexModel("created_by"),
+            IndexModel("difficulty"),
+            IndexModel("order_index"),
+            IndexModel([("is_published", 1), ("difficulty", 1), ("order_index", 1)])
+        ]),
+
+        # Quiz indexes
+        db.quizzes.create_indexes([
+            IndexModel("lesson_id"),
+            IndexModel("created_by")
+        ]),
+
+        # Progress indexes; the (user_id, is_completed) compounds keep the
+        # per-user completion counts in check_achievements index-only
+        db.lesson_progress.create_indexes([
+            IndexModel([("user_id", 1), ("lesson_id", 1)], unique=True),
+            IndexModel([("user_id", 1), ("is_completed", 1)])
+        ]),
+        db.quiz_attempts.create_indexes([
+            IndexModel("user_id"),
+            IndexModel("quiz_id"),
+            IndexModel([("user_id", 1), ("is_completed", 1)])
+        ]),
+
+        # Achievement indexes
+        db.user_achievements.create_indexes([
+            IndexModel([("user_id", 1), ("achievement_id", 1)], unique=True)
+        ]),
+
+        # Notification indexes
+        db.notifications.create_indexes([
+            IndexModel("user_id"),
+            IndexModel("created_at")
+        ])
+    )
 
 async def init_default_achievements():
     """Initialize default achievements"""
@@ -116,7 +158,12 @@ async def init_default_achievements():
         }
     ]
     
-    for achievement in default_achievements:
-        existing = await db.achievements.find_one({"id": achievement["id"]})
-        if not existing:
-            await db.achievements.insert_one(achievement)
\ No newline at end of file
+    # Single round trip: the server inserts whichever seeds are missing and
+    # leaves existing docs untouched via $setOnInsert
+    await db.achievements.bulk_write(
+        [
+            UpdateOne({"id": a["id"]}, {"$setOnInsert": a}, upsert=True)
+            for a in default_achievements
+        ],
+        ordered=False
+    )
\ No newline at end of file
@@ -1,9 +1,25 @@
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 import uuid
 
+def _utcnow() -> datetime:
+    # Single shared factory: timezone-aware (BSON stores UTC directly) and one
+    # function object instead of a datetime.utcnow reference per field
+    return datetime.now(timezone.utc)
+
+def _new_id() -> str:
+    # 32-char hex form: same uniqueness as the hyphenated str(uuid4()) but 4
+    # bytes smaller per id (and per index entry) and cheaper to produce
+    return uuid.uuid4().hex
+
+class _Identified(BaseModel):
+    # Shared id/created_at pair for stored models: one FieldInfo allocation
+    # instead of one per model, and a single place to change the id strategy
+    id: str = Field(default_factory=_new_id)
+    created_at: datetime = Field(default_factory=_utcnow)
+
 class UserRole(str, Enum):
     STUDENT = "student"
     TEACHER = "teacher"
@@ -31,9 +47,16 @@ class UserBase(BaseModel):
 class UserCreate(UserBase):
     password: str
 
-class User(UserBase):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+class LoginRequest(BaseModel):
+    email: EmailStr
+    password: str
+
+class User(UserBase, _Identified):
+    # Deserialized from Mongo on every authenticated request; frozen +
+    # extra="ignore" trims per-instance bookkeeping and nothing mutates users
+    # in memory (all updates go through the database)
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     last_login: Optional[datetime] = None
     profile_image: Optional[str] = None
     points: int = 0
@@ -50,13 +73,13 @@ class ClassBase(BaseModel):
 class ClassCreate(ClassBase):
     pass
 
-class Class(ClassBase):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class Class(ClassBase, _Identified):
     teacher_id: str
+    # Semantically a set of user ids: all writes go through $addToSet (never
+    # $push) and membership is checked server-side, backed by a multikey index
     students: List[str] = []
-    created_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = True
-    class_code: str = Field(default_factory=lambda: str(uuid.uuid4())[:8].upper())
+    class_code: str = Field(default_factory=lambda: uuid.uuid4().hex[:8].upper())
 
 # Lesson Models
 class LessonBase(BaseModel):
@@ -71,11 +94,9 @@ class LessonBase(BaseModel):
 class LessonCreate(LessonBase):
     pass
 
-class Lesson(LessonBase):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class Lesson(LessonBase, _Identified):
     created_by: str  # teacher/admin id
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     is_published: bool = False
     order_index: int = 0
     points_reward: int = 10
@@ -100,10 +121,8 @@ class QuizBase(BaseModel):
 class QuizCreate(QuizBase):
     pass
 
-class Quiz(QuizBase):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class Quiz(QuizBase, _Identified):
     created_by: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = True
     max_points: int = 0
 
@@ -111,27 +130,27 @@ class Quiz(QuizBase):
 class LessonProgress(BaseModel):
     user_id: str
     lesson_id: str
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=_utcnow)
     completed_at: Optional[datetime] = None
     is_completed: bool = False
     time_spent: int = 0  # minutes
     notes: Optional[str] = None
 
 class QuizAttempt(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     user_id: str
     quiz_id: str
     answers: Dict[str, Any] = {}
     score: float = 0.0
     max_score: float = 0.0
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=_utcnow)
     completed_at: Optional[datetime] = None
     is_completed: bool = False
     time_taken: int = 0  # seconds
 
 # Achievement Models
 class Achievement(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     title: str
     description: str
     icon: str
@@ -143,18 +162,16 @@ class Achievement(BaseModel):
 class UserAchievement(BaseModel):
     user_id: str
     achievement_id: str
-    earned_at: datetime = Field(default_factory=datetime.utcnow)
+    earned_at: datetime = Field(default_factory=_utcnow)
     progress: float = 0.0  # for progressive achievements
 
 # Notification Models
-class Notification(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+class Notification(_Identified):
     user_id: str
     title: str
     message: str
     type: str = "info"  # success, error, warning, info
     is_read: bool = False
-    created_at: datetime = Field(default_factory=datetime.utcnow)
     action_url: Optional[str] = None
 
 # Analytics Models
@@ -168,15 +185,19 @@ class UserStats(BaseModel):
     time_spent_learning: int = 0  # minutes
     average_quiz_score: float = 0.0
     achievements_earned: int = 0
-    last_updated: datetime = Field(default_factory=datetime.utcnow)
+    last_updated: datetime = Field(default_factory=_utcnow)
 
 # API Response Models
 class Token(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     access_token: str
     token_type: str = "bearer"
     user: User
 
 class APIResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     success: bool = True
     message: str = ""
     data: Optional[Any] = None
\ No newline at end of file
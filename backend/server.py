@@ -1,23 +1,36 @@
-from fastapi import FastAPI, APIRouter, Depends, HTTPException, status
+from fastapi import FastAPI, APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from pymongo import InsertOne
+from cachetools import TTLCache
+import asyncio
 import os
 import logging
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Optional
 
 # Import our models and services
 from models import *
-from auth import AuthHandler, get_current_user, EmailService, require_role
+from auth import (
+    AuthHandler, get_current_user, EmailService, require_role,
+    start_last_login_flusher, flush_last_logins,
+    _get_cached_token_user, _token_cache, _USER_PROJECTION
+)
 from database import connect_to_mongo, close_mongo_connection, get_database
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# Create the main app
-app = FastAPI(title="GO Learning Platform API", version="1.0.0")
+# Create the main app. orjson serializes the datetime/UUID-heavy list
+# responses several times faster than the stdlib encoder.
+app = FastAPI(
+    title="GO Learning Platform API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -29,31 +42,76 @@ security = HTTPBearer()
 db = None
 auth_handler = None
 email_service = EmailService()
+last_login_flusher = None
+
+# Strong references to fire-and-forget tasks (asyncio only keeps weak ones)
+_pending_tasks = set()
+
+# Read-through caches for the lesson/quiz catalog: read on every student
+# interaction, edited rarely, and 60 s of staleness is acceptable. Entries are
+# the projected Mongo dicts; callers must not mutate them.
+_lesson_cache = TTLCache(maxsize=2000, ttl=60)
+_quiz_cache = TTLCache(maxsize=2000, ttl=60)
+
+async def _get_lesson_cached(database, lesson_id: str):
+    doc = _lesson_cache.get(lesson_id)
+    if doc is None:
+        doc = await database.lessons.find_one({"id": lesson_id}, {"_id": 0})
+        if doc:
+            _lesson_cache[lesson_id] = doc
+    return doc
+
+async def _get_quiz_cached(database, quiz_id: str):
+    doc = _quiz_cache.get(quiz_id)
+    if doc is None:
+        doc = await database.quizzes.find_one({"id": quiz_id}, {"_id": 0})
+        if doc:
+            _quiz_cache[quiz_id] = doc
+    return doc
 
 @app.on_event("startup")
 async def startup_event():
-    global db, auth_handler
+    global db, auth_handler, last_login_flusher
     await connect_to_mongo()
     db = await get_database()
     auth_handler = AuthHandler(db)
+    last_login_flusher = start_last_login_flusher(db)
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    if last_login_flusher:
+        last_login_flusher.cancel()
+        await flush_last_logins(db)
     await close_mongo_connection()
 
-# Dependency to get database
+# Dependency to get database. Deliberately async even though nothing is
+# awaited: FastAPI dispatches plain `def` dependencies through the
+# threadpool, which costs far more than awaiting a trivial coroutine.
 async def get_db():
     return db
 
+# Dependency returning the AuthHandler built once at startup; endpoints used
+# to construct a fresh handler per request for no benefit
+async def get_auth_handler() -> AuthHandler:
+    return auth_handler
+
 # Dependency to get current user with database injection
 async def get_current_user_with_db(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    database = Depends(get_db)
+    database = Depends(get_db),
+    auth_handler: AuthHandler = Depends(get_auth_handler)
 ):
-    auth_handler = AuthHandler(database)
     token = credentials.credentials
+
+    # Shared verified-token cache (see auth.py): a hit skips both the
+    # signature verify and the users round trip. Failed verifications are
+    # never cached, and entries die at the token's own exp.
+    cached_user = _get_cached_token_user(token)
+    if cached_user is not None:
+        return cached_user
+
     payload = auth_handler.decode_token(token)
-    
+
     user_id = payload.get("sub")
     if user_id is None:
         raise HTTPException(
@@ -73,15 +131,19 @@ async def get_current_user_with_db(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
-    
+
+    _token_cache[token] = (user, payload.get("exp"))
     return user
 
 # ============ AUTHENTICATION ENDPOINTS ============
 
 @api_router.post("/auth/register", response_model=APIResponse)
-async def register_user(user_data: UserCreate, database = Depends(get_db)):
+async def register_user(
+    user_data: UserCreate,
+    background_tasks: BackgroundTasks,
+    auth_handler: AuthHandler = Depends(get_auth_handler)
+):
     """Register a new user"""
-    auth_handler = AuthHandler(database)
     
     # Check if user already exists
     existing_user = await auth_handler.get_user_by_email(user_data.email)
@@ -92,7 +154,7 @@ async def register_user(user_data: UserCreate, database = Depends(get_db)):
         )
     
     # Create user
-    user_dict = user_data.dict()
+    user_dict = user_data.model_dump()
     new_user = await auth_handler.create_user(user_dict)
     
     if not new_user:
@@ -101,10 +163,13 @@ async def register_user(user_data: UserCreate, database = Depends(get_db)):
             detail="Failed to create user"
         )
     
-    # Send verification email
+    # Queue the verification email to fire after the response: SMTP round
+    # trips are hundreds of ms and don't gate registration correctness
     verification_token = auth_handler.generate_verification_token(user_data.email)
-    await email_service.send_verification_email(user_data.email, verification_token)
-    
+    background_tasks.add_task(
+        email_service.send_verification_email, user_data.email, verification_token
+    )
+
     return APIResponse(
         success=True,
         message="User registered successfully. Please check your email for verification.",
@@ -112,20 +177,13 @@ async def register_user(user_data: UserCreate, database = Depends(get_db)):
     )
 
 @api_router.post("/auth/login", response_model=Token)
-async def login_user(credentials: dict, database = Depends(get_db)):
+async def login_user(
+    credentials: LoginRequest,
+    auth_handler: AuthHandler = Depends(get_auth_handler)
+):
     """Login user"""
-    auth_handler = AuthHandler(database)
-    
-    email = credentials.get('email')
-    password = credentials.get('password')
-    
-    if not email or not password:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email and password are required"
-        )
-    
-    user = await auth_handler.authenticate_user(email, password)
+
+    user = await auth_handler.authenticate_user(credentials.email, credentials.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -146,9 +204,11 @@ async def login_user(credentials: dict, database = Depends(get_db)):
     return Token(access_token=access_token, user=user)
 
 @api_router.get("/auth/verify-email")
-async def verify_email(token: str, database = Depends(get_db)):
+async def verify_email(
+    token: str,
+    auth_handler: AuthHandler = Depends(get_auth_handler)
+):
     """Verify user email"""
-    auth_handler = AuthHandler(database)
     
     email = await auth_handler.verify_email_token(token)
     success = await auth_handler.verify_user_email(email)
@@ -171,20 +231,29 @@ async def get_current_user_info(current_user: User = Depends(get_current_user_wi
 
 # ============ USER MANAGEMENT ENDPOINTS ============
 
-@api_router.get("/users", response_model=List[User])
+@api_router.get("/users")
 async def get_users(
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.TEACHER])),
     database = Depends(get_db)
 ):
     """Get all users (admin/teacher only)"""
-    if current_user.role not in [UserRole.ADMIN, UserRole.TEACHER]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions"
-        )
-    
-    users = await database.users.find().to_list(1000)
-    return [User(**user) for user in users]
+    # Stream the JSON array straight off the cursor instead of materializing
+    # every user in RAM first: memory stays at one getMore batch (200 docs)
+    # however large the collection grows, and the first bytes go out after
+    # the first batch. The projection keeps the password hash in auth;
+    # model_construct skips re-validating our own documents.
+    async def user_stream():
+        yield b"["
+        first = True
+        async for doc in database.users.find({}, _USER_PROJECTION).batch_size(200):
+            if first:
+                first = False
+            else:
+                yield b","
+            yield User.model_construct(**doc).model_dump_json().encode()
+        yield b"]"
+
+    return StreamingResponse(user_stream(), media_type="application/json")
 
 @api_router.get("/users/{user_id}", response_model=User)
 async def get_user_by_id(
@@ -199,49 +268,45 @@ async def get_user_by_id(
             detail="Insufficient permissions"
         )
     
-    user = await database.users.find_one({"id": user_id})
+    user = await database.users.find_one({"id": user_id}, _USER_PROJECTION)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    
-    return User(**user)
+
+    return User.model_construct(**user)
 
 # ============ CLASS MANAGEMENT ENDPOINTS ============
 
 @api_router.post("/classes", response_model=Class)
 async def create_class(
     class_data: ClassCreate,
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: User = Depends(require_role([UserRole.TEACHER, UserRole.ADMIN])),
     database = Depends(get_db)
 ):
     """Create a new class (teachers and admins only)"""
-    if current_user.role not in [UserRole.TEACHER, UserRole.ADMIN]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only teachers and admins can create classes"
-        )
-    
-    class_dict = class_data.dict()
+    class_dict = class_data.model_dump()
     class_dict["teacher_id"] = current_user.id
     
     new_class = Class(**class_dict)
-    await database.classes.insert_one(new_class.dict())
+    await database.classes.insert_one(new_class.model_dump())
     
     return new_class
 
-@api_router.get("/classes", response_model=List[Class])
+@api_router.get("/classes")
 async def get_classes(
     current_user: User = Depends(get_current_user_with_db),
     database = Depends(get_db)
 ):
     """Get classes for current user"""
     if current_user.role == UserRole.TEACHER:
-        classes = await database.classes.find({"teacher_id": current_user.id}).to_list(100)
+        filter_query = {"teacher_id": current_user.id}
     elif current_user.role == UserRole.ADMIN:
-        classes = await database.classes.find().to_list(100)
+        filter_query = {}
     else:  # Student
-        classes = await database.classes.find({"students": current_user.id}).to_list(100)
-    
-    return [Class(**cls) for cls in classes]
+        filter_query = {"students": current_user.id}
+
+    # Motor already produced JSON-shaped dicts; hand them to orjson directly
+    # instead of paying a pydantic construction + serialization pass per item
+    return await database.classes.find(filter_query, {"_id": 0}).to_list(100)
 
 @api_router.post("/classes/{class_id}/join")
 async def join_class(
@@ -257,24 +322,31 @@ async def join_class(
             detail="Only students can join classes"
         )
     
-    # Find class by code and ID
-    class_doc = await database.classes.find_one({"id": class_id, "class_code": class_code})
-    if not class_doc:
-        raise HTTPException(status_code=404, detail="Invalid class code")
-    
-    # Check if student already in class
-    if current_user.id in class_doc.get("students", []):
+    # Validate and enroll in one atomic write: the filter only matches when
+    # the code is right and the student isn't already in the list, so the
+    # find-then-push TOCTOU race (double enrollment under concurrency) is
+    # gone and the happy path costs one round trip
+    result = await database.classes.update_one(
+        {
+            "id": class_id,
+            "class_code": class_code,
+            "students": {"$ne": current_user.id}
+        },
+        {"$addToSet": {"students": current_user.id}}
+    )
+
+    if result.modified_count == 0:
+        # Disambiguate only on the failure branch
+        class_doc = await database.classes.find_one(
+            {"id": class_id, "class_code": class_code}, {"_id": 0, "id": 1}
+        )
+        if not class_doc:
+            raise HTTPException(status_code=404, detail="Invalid class code")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Already enrolled in this class"
         )
-    
-    # Add student to class
-    await database.classes.update_one(
-        {"id": class_id},
-        {"$push": {"students": current_user.id}}
-    )
-    
+
     return APIResponse(
         success=True,
         message="Successfully joined class"
@@ -285,37 +357,41 @@ async def join_class(
 @api_router.post("/lessons", response_model=Lesson)
 async def create_lesson(
     lesson_data: LessonCreate,
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: User = Depends(require_role([UserRole.TEACHER, UserRole.ADMIN])),
     database = Depends(get_db)
 ):
     """Create a new lesson (teachers and admins only)"""
-    if current_user.role not in [UserRole.TEACHER, UserRole.ADMIN]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only teachers and admins can create lessons"
-        )
-    
-    lesson_dict = lesson_data.dict()
+    lesson_dict = lesson_data.model_dump()
     lesson_dict["created_by"] = current_user.id
     
     new_lesson = Lesson(**lesson_dict)
-    await database.lessons.insert_one(new_lesson.dict())
-    
+    await database.lessons.insert_one(new_lesson.model_dump())
+    _lesson_cache.pop(new_lesson.id, None)
+
     return new_lesson
 
-@api_router.get("/lessons", response_model=List[Lesson])
+# The list view omits the multi-KB content blob; the detail endpoint serves it
+_LESSON_LIST_PROJECTION = {
+    "_id": 0, "id": 1, "title": 1, "description": 1, "difficulty": 1,
+    "estimated_time": 1, "go_code_examples": 1, "key_concepts": 1,
+    "points_reward": 1, "order_index": 1, "is_published": 1,
+    "created_by": 1, "created_at": 1, "updated_at": 1
+}
+
+@api_router.get("/lessons")
 async def get_lessons(
     difficulty: Optional[DifficultyLevel] = None,
     current_user: User = Depends(get_current_user_with_db),
     database = Depends(get_db)
 ):
-    """Get all published lessons"""
+    """Get all published lessons (without content; fetch a lesson for that)"""
     filter_query = {"is_published": True}
     if difficulty:
         filter_query["difficulty"] = difficulty
-    
-    lessons = await database.lessons.find(filter_query).sort("order_index", 1).to_list(100)
-    return [Lesson(**lesson) for lesson in lessons]
+
+    return await database.lessons.find(
+        filter_query, _LESSON_LIST_PROJECTION
+    ).sort("order_index", 1).to_list(100)
 
 @api_router.get("/lessons/{lesson_id}", response_model=Lesson)
 async def get_lesson(
@@ -324,7 +400,7 @@ async def get_lesson(
     database = Depends(get_db)
 ):
     """Get specific lesson"""
-    lesson = await database.lessons.find_one({"id": lesson_id})
+    lesson = await _get_lesson_cached(database, lesson_id)
     if not lesson:
         raise HTTPException(status_code=404, detail="Lesson not found")
     
@@ -340,34 +416,33 @@ async def get_lesson(
 @api_router.post("/quizzes", response_model=Quiz)
 async def create_quiz(
     quiz_data: QuizCreate,
-    current_user: User = Depends(get_current_user_with_db),
+    current_user: User = Depends(require_role([UserRole.TEACHER, UserRole.ADMIN])),
     database = Depends(get_db)
 ):
     """Create a new quiz"""
-    if current_user.role not in [UserRole.TEACHER, UserRole.ADMIN]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only teachers and admins can create quizzes"
-        )
-    
-    quiz_dict = quiz_data.dict()
+    quiz_dict = quiz_data.model_dump()
     quiz_dict["created_by"] = current_user.id
     quiz_dict["max_points"] = sum(q.points for q in quiz_data.questions)
     
     new_quiz = Quiz(**quiz_dict)
-    await database.quizzes.insert_one(new_quiz.dict())
-    
+    await database.quizzes.insert_one(new_quiz.model_dump())
+    _quiz_cache.pop(new_quiz.id, None)
+
     return new_quiz
 
-@api_router.get("/lessons/{lesson_id}/quizzes", response_model=List[Quiz])
+@api_router.get("/lessons/{lesson_id}/quizzes")
 async def get_lesson_quizzes(
     lesson_id: str,
     current_user: User = Depends(get_current_user_with_db),
     database = Depends(get_db)
 ):
     """Get quizzes for a specific lesson"""
-    quizzes = await database.quizzes.find({"lesson_id": lesson_id, "is_active": True}).to_list(100)
-    return [Quiz(**quiz) for quiz in quizzes]
+    # Never ship the answer key: correct answers and explanations stay
+    # server-side until the attempt is graded
+    return await database.quizzes.find(
+        {"lesson_id": lesson_id, "is_active": True},
+        {"_id": 0, "questions.correct_answer": 0, "questions.explanation": 0}
+    ).to_list(100)
 
 @api_router.post("/quizzes/{quiz_id}/attempt", response_model=QuizAttempt)
 async def start_quiz_attempt(
@@ -376,7 +451,7 @@ async def start_quiz_attempt(
     database = Depends(get_db)
 ):
     """Start a new quiz attempt"""
-    quiz = await database.quizzes.find_one({"id": quiz_id})
+    quiz = await _get_quiz_cached(database, quiz_id)
     if not quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
     
@@ -386,7 +461,9 @@ async def start_quiz_attempt(
         max_score=quiz["max_points"]
     )
     
-    await database.quiz_attempts.insert_one(attempt.dict())
+    # Hot per-user doc: drop the None sentinels (completed_at etc.) from the
+    # stored form; readers get them back from the model defaults
+    await database.quiz_attempts.insert_one(attempt.model_dump(exclude_none=True))
     
     # Return quiz questions without correct answers
     quiz_for_student = Quiz(**quiz)
@@ -404,23 +481,25 @@ async def start_lesson(
     database = Depends(get_db)
 ):
     """Start or update lesson progress"""
-    # Check if lesson exists
-    lesson = await database.lessons.find_one({"id": lesson_id})
+    # The lesson-exists and progress-exists reads are independent; run them
+    # concurrently instead of serializing two round trips
+    lesson, existing_progress = await asyncio.gather(
+        _get_lesson_cached(database, lesson_id),
+        database.lesson_progress.find_one({
+            "user_id": current_user.id,
+            "lesson_id": lesson_id
+        })
+    )
+
     if not lesson:
         raise HTTPException(status_code=404, detail="Lesson not found")
-    
-    # Check if progress already exists
-    existing_progress = await database.lesson_progress.find_one({
-        "user_id": current_user.id,
-        "lesson_id": lesson_id
-    })
-    
+
     if existing_progress:
         return APIResponse(success=True, message="Lesson already started")
     
     # Create new progress
     progress = LessonProgress(user_id=current_user.id, lesson_id=lesson_id)
-    await database.lesson_progress.insert_one(progress.dict())
+    await database.lesson_progress.insert_one(progress.model_dump(exclude_none=True))
     
     return APIResponse(success=True, message="Lesson started")
 
@@ -431,7 +510,7 @@ async def complete_lesson(
     database = Depends(get_db)
 ):
     """Mark lesson as completed"""
-    lesson = await database.lessons.find_one({"id": lesson_id})
+    lesson = await _get_lesson_cached(database, lesson_id)
     if not lesson:
         raise HTTPException(status_code=404, detail="Lesson not found")
     
@@ -453,61 +532,97 @@ async def complete_lesson(
             {"id": current_user.id},
             {"$inc": {"points": lesson["points_reward"]}}
         )
-        
-        # Check for achievements
-        await check_achievements(current_user.id, database)
-    
+
+        # Resolve achievements off the response path: the client sees the
+        # completion after three round trips instead of also waiting on the
+        # award pipeline. The task set keeps a strong reference so the task
+        # isn't garbage-collected mid-flight.
+        task = asyncio.create_task(check_achievements(current_user.id, database))
+        _pending_tasks.add(task)
+        task.add_done_callback(_pending_tasks.discard)
+
     return APIResponse(success=True, message="Lesson completed")
 
 # ============ ACHIEVEMENT SYSTEM ============
 
 async def check_achievements(user_id: str, database):
     """Check and award achievements for a user"""
-    # Get user stats
-    lessons_completed = await database.lesson_progress.count_documents({
-        "user_id": user_id,
-        "is_completed": True
-    })
-    
-    quizzes_completed = await database.quiz_attempts.count_documents({
-        "user_id": user_id,
-        "is_completed": True
-    })
-    
-    # Get achievements user doesn't have yet
-    user_achievements = await database.user_achievements.find({"user_id": user_id}).to_list(100)
-    earned_achievement_ids = [ua["achievement_id"] for ua in user_achievements]
-    
-    available_achievements = await database.achievements.find({
-        "is_active": True,
-        "id": {"$nin": earned_achievement_ids}
-    }).to_list(100)
-    
-    # Check each achievement
+    # All four reads in a single round trip: anchor on the user doc and
+    # $lookup the progress counts, the already-earned set and the active
+    # achievement catalog with uncorrelated sub-pipelines. ($unionWith is not
+    # allowed inside $facet, so $lookup is the one-RTT shape available here.)
+    completed_filter = {"user_id": user_id, "is_completed": True}
+    stats = await database.users.aggregate([
+        {"$match": {"id": user_id}},
+        {"$limit": 1},
+        {"$project": {"_id": 0, "id": 1}},
+        {"$lookup": {
+            "from": "lesson_progress",
+            "pipeline": [{"$match": completed_filter}, {"$count": "n"}],
+            "as": "lessons_done"
+        }},
+        {"$lookup": {
+            "from": "quiz_attempts",
+            "pipeline": [{"$match": completed_filter}, {"$count": "n"}],
+            "as": "quizzes_done"
+        }},
+        {"$lookup": {
+            "from": "user_achievements",
+            "pipeline": [
+                {"$match": {"user_id": user_id}},
+                {"$project": {"_id": 0, "achievement_id": 1}}
+            ],
+            "as": "earned"
+        }},
+        {"$lookup": {
+            "from": "achievements",
+            "pipeline": [{"$match": {"is_active": True}}],
+            "as": "available"
+        }}
+    ]).to_list(length=1)
+
+    if not stats:
+        return
+    stats = stats[0]
+
+    lessons_completed = stats["lessons_done"][0]["n"] if stats["lessons_done"] else 0
+    quizzes_completed = stats["quizzes_done"][0]["n"] if stats["quizzes_done"] else 0
+    earned_achievement_ids = {ua["achievement_id"] for ua in stats["earned"]}
+    available_achievements = [
+        a for a in stats["available"] if a["id"] not in earned_achievement_ids
+    ]
+    
+    # Check each achievement, accumulating awards instead of writing per item
+    ua_ops = []
+    points_awarded = 0
     for achievement in available_achievements:
         criteria = achievement["criteria"]
         earned = False
-        
+
         if "lessons_completed" in criteria and lessons_completed >= criteria["lessons_completed"]:
             earned = True
-        
+
         if earned:
-            # Award achievement
             user_achievement = UserAchievement(
                 user_id=user_id,
                 achievement_id=achievement["id"],
                 progress=1.0
             )
-            
-            await database.user_achievements.insert_one(user_achievement.dict())
-            
-            # Award points
-            await database.users.update_one(
+            ua_ops.append(InsertOne(user_achievement.model_dump()))
+            points_awarded += achievement["points_reward"]
+
+    # One unordered bulk_write for the achievement rows plus a single $inc of
+    # the summed reward, instead of two sequential round trips per award
+    if ua_ops:
+        await asyncio.gather(
+            database.user_achievements.bulk_write(ua_ops, ordered=False),
+            database.users.update_one(
                 {"id": user_id},
-                {"$inc": {"points": achievement["points_reward"]}}
+                {"$inc": {"points": points_awarded}}
             )
+        )
 
-@api_router.get("/users/{user_id}/achievements", response_model=List[UserAchievement])
+@api_router.get("/users/{user_id}/achievements")
 async def get_user_achievements(
     user_id: str,
     current_user: User = Depends(get_current_user_with_db),
@@ -520,8 +635,9 @@ async def get_user_achievements(
             detail="Insufficient permissions"
         )
     
-    achievements = await database.user_achievements.find({"user_id": user_id}).to_list(100)
-    return [UserAchievement(**achievement) for achievement in achievements]
+    return await database.user_achievements.find(
+        {"user_id": user_id}, {"_id": 0}
+    ).to_list(100)
 
 # ============ BASIC ENDPOINTS ============
 
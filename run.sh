@@ -0,0 +1,21 @@
+#!/usr/bin/env bash
+# Production launch for the backend API.
+#
+# uvicorn[standard] (see backend/requirements.txt) pulls in uvloop and
+# httptools; running with them swaps the default asyncio selector loop for
+# libuv and the pure-Python HTTP parser for C, which speeds up every await
+# in every endpoint. Workers default to one per core - note that the
+# in-process caches (tokens, lessons, quizzes) are per worker.
+set -euo pipefail
+
+WORKERS="${WORKERS:-$(nproc)}"
+PORT="${PORT:-8000}"
+
+exec uvicorn server:app \
+  --app-dir backend \
+  --host 0.0.0.0 \
+  --port "$PORT" \
+  --workers "$WORKERS" \
+  --loop uvloop \
+  --http httptools \
+  --log-level info